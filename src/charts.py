@@ -1,18 +1,57 @@
 import numpy as np
 from matplotlib import pyplot as plt
 
+from constants import s0
 from profiles import variable_tariff_profile
 
 
-def solar_vs_demand_chart(hour, solar, demand, results_folder):
+def _steps(start, duration, values):
+    """Step-plot points for per-step values held over [start, start + duration]."""
+    start, duration, values = list(start), list(duration), list(values)
+    return start + [start[-1] + duration[-1]], values + [values[-1]]
+
+
+def _profile_steps(values):
+    """Step-plot points for a uniform 24h profile of any length."""
+    width = 24 / len(values)
+    start = [i * width for i in range(len(values))]
+    return _steps(start, [width] * len(values), values)
+
+
+def _df_steps(df, column):
+    """Step-plot points for a solver result column."""
+    return _steps(df["Hour"], df["Duration"], df[column])
+
+
+def _soc_points(df):
+    """SOC is the end-of-step value; start from s0 at hour 0."""
+    return [0] + list(df["Hour"] + df["Duration"]), [s0] + list(df["SOC"])
+
+
+def solar_vs_demand_chart(solar, demand, results_folder):
     """Plot 24h solar generation (bars) vs load demand (line)."""
     _, ax = plt.subplots(figsize=(11, 5))
 
-    ax.bar(hour, solar, color="#f39c12", alpha=0.7, label="Solar Generation", width=0.9)
+    width = 24 / len(solar)
+    ax.bar(
+        [i * width for i in range(len(solar))],
+        solar,
+        color="#f39c12",
+        alpha=0.7,
+        label="Solar Generation",
+        width=0.9 * width,
+        align="edge",
+    )
     ax.set_xlabel("Hour")
     ax.set_ylabel("Solar Power (kW)")
 
-    ax.plot(hour, demand, "s-", color="#e74c3c", linewidth=3, label="Demand")
+    ax.step(
+        *_profile_steps(demand),
+        where="post",
+        color="#e74c3c",
+        linewidth=3,
+        label="Demand",
+    )
     ax.set_ylabel("Demand (kW)")
 
     plt.title("Solar Generation vs Load Demand Profile (24h)")
@@ -27,11 +66,12 @@ def solar_vs_demand_chart(hour, solar, demand, results_folder):
 def scenario_chart(df, actual_cost, exported, scenario_name, results_folder):
     """Plot hourly solar, demand, buy, sell, and SOC."""
     plt.figure(figsize=(10, 6))
-    plt.plot(df["Hour"], df["Solar"], label="Solar", marker="o")
-    plt.plot(df["Hour"], df["Demand"], label="Demand", marker="s")
-    plt.plot(df["Hour"], df["Buy"], label="Buy", linestyle="--")
-    plt.plot(df["Hour"], df["Sell"], label="Sell", linestyle="-.")
-    plt.fill_between(df["Hour"], 0, df["SOC"], alpha=0.3, label="SOC")
+    plt.step(*_df_steps(df, "Solar"), where="post", label="Solar", marker="o")
+    plt.step(*_df_steps(df, "Demand"), where="post", label="Demand", marker="s")
+    plt.step(*_df_steps(df, "Buy"), where="post", label="Buy", linestyle="--")
+    plt.step(*_df_steps(df, "Sell"), where="post", label="Sell", linestyle="-.")
+    soc_hours, soc = _soc_points(df)
+    plt.fill_between(soc_hours, 0, soc, alpha=0.3, label="SOC")
     plt.title(
         f"{scenario_name}\nExport: {exported:.1f} kWh | Actual Cost: {actual_cost:.0f} AMD"
     )
@@ -46,9 +86,12 @@ def scenario_chart(df, actual_cost, exported, scenario_name, results_folder):
 
 def costs_chart(df, C_buy, C_sell, actual_cost, T, scenario_name, results_folder):
     """Pie chart of grid purchase vs export revenue."""
+    dt = df["Duration"]
     costs = {
-        "Grid Purchase": sum(C_buy[t] * df["Buy"].iloc[t] for t in T),
-        "Revenue from Export": sum(C_sell[t] * df["Sell"].iloc[t] for t in T),
+        "Grid Purchase": sum(C_buy[t] * df["Buy"].iloc[t] * dt.iloc[t] for t in T),
+        "Revenue from Export": sum(
+            C_sell[t] * df["Sell"].iloc[t] * dt.iloc[t] for t in T
+        ),
     }
     plt.figure(figsize=(10, 6))
     plt.pie(
@@ -82,11 +125,26 @@ def sources_chart(df, scenario_name, results_folder):
 
     bottom = 0
     for data, color, label in zip(sources, colors, labels):
-        plt.bar(hours, data, bottom=bottom, label=label, color=color, alpha=0.9)
+        plt.bar(
+            hours,
+            data,
+            width=0.9 * df["Duration"],
+            align="edge",
+            bottom=bottom,
+            label=label,
+            color=color,
+            alpha=0.9,
+        )
         bottom += data
 
-    plt.plot(
-        hours, df["Demand"], "k-", linewidth=3, marker="o", markersize=4, label="Demand"
+    plt.step(
+        *_df_steps(df, "Demand"),
+        "k-",
+        where="post",
+        linewidth=3,
+        marker="o",
+        markersize=4,
+        label="Demand",
     )
 
     plt.title(
@@ -109,11 +167,11 @@ def sources_chart(df, scenario_name, results_folder):
 def decision_variables_chart(df, scenario_name, results_folder):
     """Plot binary charge/discharge indicators."""
     _, ax = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
-    ax[0].step(df["Hour"], df["y_c"], where="post", color="purple", linewidth=2)
+    ax[0].step(*_df_steps(df, "y_c"), where="post", color="purple", linewidth=2)
     ax[0].set_yticks([0, 1])
     ax[0].set_ylabel("Charge")
     ax[0].set_xlabel("Hour")
-    ax[1].step(df["Hour"], df["y_d"], where="post", color="red", linewidth=2)
+    ax[1].step(*_df_steps(df, "y_d"), where="post", color="red", linewidth=2)
     ax[1].set_yticks([0, 1])
     ax[1].set_ylabel("Discharge")
     ax[1].set_xlabel("Hour")
@@ -134,7 +192,8 @@ def battery_charging_chart(df, scenario_name, results_folder):
         color="#27ae60",
         alpha=0.8,
         label="Charging (+)",
-        width=0.8,
+        width=0.9 * df["Duration"],
+        align="edge",
     )
     plt.bar(
         df["Hour"],
@@ -142,12 +201,12 @@ def battery_charging_chart(df, scenario_name, results_folder):
         color="#e74c3c",
         alpha=0.8,
         label="Discharging (-)",
-        width=0.8,
+        width=0.9 * df["Duration"],
+        align="edge",
     )
     plt.axhline(0, color="black", linewidth=1.5)
     plt.plot(
-        df["Hour"],
-        df["SOC"],
+        *_soc_points(df),
         "o-",
         color="#9b59b6",
         linewidth=3,
@@ -169,6 +228,11 @@ def battery_charging_chart(df, scenario_name, results_folder):
     plt.close()
 
 
+def _energy(df, column):
+    """Total energy (kWh) of a power column (kW) over variable-length steps."""
+    return (df[column] * df["Duration"]).sum()
+
+
 def comparison_chart(df_lin_A, df_lin_B, df_nonlin_A, df_nonlin_B, results_folder):
     labels = [
         "Solar Generated",
@@ -178,28 +242,28 @@ def comparison_chart(df_lin_A, df_lin_B, df_nonlin_A, df_nonlin_B, results_folde
     ]
 
     lin_A = [
-        df_lin_A["Solar"].sum(),
-        df_lin_A["Buy"].sum(),
-        df_lin_A["Discharge"].sum(),
-        df_lin_A["Sell"].sum(),
+        _energy(df_lin_A, "Solar"),
+        _energy(df_lin_A, "Buy"),
+        _energy(df_lin_A, "Discharge"),
+        _energy(df_lin_A, "Sell"),
     ]
     lin_B = [
-        df_lin_B["Solar"].sum(),
-        df_lin_B["Buy"].sum(),
-        df_lin_B["Discharge"].sum(),
-        df_lin_B["Sell"].sum(),
+        _energy(df_lin_B, "Solar"),
+        _energy(df_lin_B, "Buy"),
+        _energy(df_lin_B, "Discharge"),
+        _energy(df_lin_B, "Sell"),
     ]
     nonlin_A = [
-        df_nonlin_A["Solar"].sum(),
-        df_nonlin_A["Buy"].sum(),
-        df_nonlin_A["Discharge"].sum(),
-        df_nonlin_A["Sell"].sum(),
+        _energy(df_nonlin_A, "Solar"),
+        _energy(df_nonlin_A, "Buy"),
+        _energy(df_nonlin_A, "Discharge"),
+        _energy(df_nonlin_A, "Sell"),
     ]
     nonlin_B = [
-        df_nonlin_B["Solar"].sum(),
-        df_nonlin_B["Buy"].sum(),
-        df_nonlin_B["Discharge"].sum(),
-        df_nonlin_B["Sell"].sum(),
+        _energy(df_nonlin_B, "Solar"),
+        _energy(df_nonlin_B, "Buy"),
+        _energy(df_nonlin_B, "Discharge"),
+        _energy(df_nonlin_B, "Sell"),
     ]
 
     x = np.arange(len(labels))
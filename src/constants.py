@@ -1,9 +1,17 @@
-T = range(24)
+# Time resolution of the optimization (minutes per step): 60, 30, 15, 5, ...
+step_minutes = 60
+
+# Adaptive aggregation: merge consecutive steps whose solar, demand and tariff
+# values stay within aggregation_tol * (profile range) into one longer step
+adaptive = False
+aggregation_tol = 0.05
 
 # Grid buy price (AMD/kWh): off-peak 0–6, peak 7–22, off-peak 23
 C_buy = [38] * 7 + [52] * 16 + [38]
 
-# Solar generation (kW) and load demand (kW) per hour
+# Solar generation (kW) and load demand (kW): average power per hour.
+# Any uniform 24h resolution works (e.g. 96 values of 15-min metering data);
+# the solvers resample these profiles to step_minutes.
 E_solar = [0] * 7 + [1, 4, 10, 18, 28, 36, 40, 41, 38, 32, 22, 12, 5, 2] + [0] * 3
 E_demand = [
     5,
@@ -32,7 +40,7 @@ E_demand = [
     8,
 ]
 
-# Battery: capacity (kWh), max charge/discharge (kW), round-trip efficiencies, initial SOC (kWh)
+# Battery: capacity (kWh), max charge/discharge power (kW), efficiencies, initial SOC (kWh)
 E_cap = 30
 P_charge_max = 12
 P_discharge_max = 12
@@ -40,9 +48,9 @@ charge_eff = 0.95
 discharge_eff = 0.95
 s0 = 15
 
-# Grid limits (kW)
+# Grid power limits (kW)
 P_buy_max = 60
 P_sell_max = 30
 
-# Loss coefficient
+# Quadratic loss coefficient (loss power in kW)
 k = 0.012
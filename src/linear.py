@@ -3,14 +3,27 @@ from pulp import (PULP_CBC_CMD, LpBinary, LpMaximize, LpProblem, LpVariable,
                   value)
 
 import charts
-from constants import (C_buy, E_cap, E_demand, E_solar, P_buy_max,
-                       P_charge_max, P_discharge_max, P_sell_max, T,
-                       charge_eff, discharge_eff, s0)
-
-
-def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
+from constants import (E_cap, P_buy_max, P_charge_max, P_discharge_max,
+                       P_sell_max, adaptive, aggregation_tol, charge_eff,
+                       discharge_eff, s0, step_minutes)
+from profiles import time_grid
+
+
+def solve_scenario(
+    C_sell,
+    scenario_name,
+    results_folder,
+    save_results=True,
+    step_minutes=step_minutes,
+    adaptive=adaptive,
+    aggregation_tol=aggregation_tol,
+):
     """Solve MILP for one tariff scenario; returns DataFrame or dict if save_results=False."""
-    baseline_cost = sum(C_buy[t] * E_demand[t] for t in T)
+    start, dt, E_solar, E_demand, C_buy, C_sell = time_grid(
+        C_sell, step_minutes, adaptive, aggregation_tol
+    )
+    T = range(len(dt))
+    baseline_cost = sum(C_buy[t] * E_demand[t] * dt[t] for t in T)
 
     model = LpProblem(f"Microgrid_{scenario_name}", LpMaximize)
 
@@ -24,7 +37,7 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
     y_discharge = LpVariable.dicts("ytdischarge", T, cat=LpBinary)
 
     # --- Objective: maximize revenue from export minus grid purchase cost ---
-    model += sum(C_sell[t] * x_sell[t] - C_buy[t] * x_buy[t] for t in T)
+    model += sum(dt[t] * (C_sell[t] * x_sell[t] - C_buy[t] * x_buy[t]) for t in T)
 
     # --- Constraints ---
     for t in T:
@@ -33,15 +46,11 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
             == E_demand[t] + x_charge[t] + x_sell[t]
         )
 
-        if t == 0:
-            model += (
-                s[t] == s0 + charge_eff * x_charge[t] - x_discharge[t] / discharge_eff
-            )
-        else:
-            model += (
-                s[t]
-                == s[t - 1] + charge_eff * x_charge[t] - x_discharge[t] / discharge_eff
-            )
+        # Power (kW) over a step of dt[t] hours changes the SOC (kWh)
+        s_prev = s0 if t == 0 else s[t - 1]
+        model += s[t] == s_prev + dt[t] * (
+            charge_eff * x_charge[t] - x_discharge[t] / discharge_eff
+        )
 
         model += x_charge[t] <= P_charge_max * y_charge[t]
         model += x_discharge[t] <= P_discharge_max * y_discharge[t]
@@ -57,7 +66,8 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
     for t in T:
         data.append(
             {
-                "Hour": t,
+                "Hour": start[t],
+                "Duration": dt[t],
                 "Solar": E_solar[t],
                 "Demand": E_demand[t],
                 "Buy": value(x_buy[t]),
@@ -72,7 +82,7 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
     df = pd.DataFrame(data)
 
     actual_cost = value(model.objective)
-    exported = df["Sell"].sum()
+    exported = (df["Sell"] * df["Duration"]).sum()
 
     if not save_results:
         return {
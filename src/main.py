@@ -3,7 +3,7 @@ import os
 import charts
 import linear
 import non_linear
-from constants import E_demand, E_solar, T
+from constants import E_demand, E_solar
 from profiles import variable_tariff_profile
 
 RESULTS_FOLDER = "results"
@@ -14,7 +14,7 @@ os.makedirs(RESULTS_FOLDER, exist_ok=True)
 os.makedirs(LINEAR_FOLDER, exist_ok=True)
 os.makedirs(NON_LINEAR_FOLDER, exist_ok=True)
 
-charts.solar_vs_demand_chart(T, E_solar, E_demand, RESULTS_FOLDER)
+charts.solar_vs_demand_chart(E_solar, E_demand, RESULTS_FOLDER)
 
 scenario1_prices = variable_tariff_profile(22, 22)
 scenario2_prices = variable_tariff_profile(35, 48)
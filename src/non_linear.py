@@ -2,16 +2,29 @@ import pandas as pd
 from gekko import GEKKO
 
 import charts
-from constants import (C_buy, E_cap, E_demand, E_solar, P_buy_max,
-                       P_charge_max, P_discharge_max, P_sell_max, T,
-                       charge_eff, discharge_eff, k, s0)
-
-
-def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
+from constants import (E_cap, P_buy_max, P_charge_max, P_discharge_max,
+                       P_sell_max, adaptive, aggregation_tol, charge_eff,
+                       discharge_eff, k, s0, step_minutes)
+from profiles import time_grid
+
+
+def solve_scenario(
+    C_sell,
+    scenario_name,
+    results_folder,
+    save_results=True,
+    step_minutes=step_minutes,
+    adaptive=adaptive,
+    aggregation_tol=aggregation_tol,
+):
     """Solve MINLP for one tariff scenario; returns DataFrame or dict if save_results=False."""
-    baseline_cost = sum(C_buy[t] * E_demand[t] for t in T)
+    start, dt, E_solar, E_demand, C_buy, C_sell = time_grid(
+        C_sell, step_minutes, adaptive, aggregation_tol
+    )
+    T = range(len(dt))
+    baseline_cost = sum(C_buy[t] * E_demand[t] * dt[t] for t in T)
     m = GEKKO(remote=False)
-    nt = 24
+    nt = len(dt)
 
     x_buy = [m.Var(lb=0, ub=P_buy_max) for _ in range(nt)]
     x_sell = [m.Var(lb=0, ub=P_sell_max) for _ in range(nt)]
@@ -22,7 +35,9 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
     y_charge = [m.Var(lb=0, ub=1, integer=True) for _ in range(nt)]
     y_discharge = [m.Var(lb=0, ub=1, integer=True) for _ in range(nt)]
 
-    m.Maximize(sum(C_sell[t] * x_sell[t] - C_buy[t] * x_buy[t] for t in range(nt)))
+    m.Maximize(
+        sum(dt[t] * (C_sell[t] * x_sell[t] - C_buy[t] * x_buy[t]) for t in range(nt))
+    )
 
     # Energy balance
     for t in range(nt):
@@ -35,19 +50,13 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
         loss = k * (
             x_charge[t] ** 2 / P_charge_max + x_discharge[t] ** 2 / P_discharge_max
         )
-        if t == 0:
-            m.Equation(
-                s[t]
-                == s0 + charge_eff * x_charge[t] - x_discharge[t] / discharge_eff - loss
-            )
-        else:
-            m.Equation(
-                s[t]
-                == s[t - 1]
-                + charge_eff * x_charge[t]
-                - x_discharge[t] / discharge_eff
-                - loss
-            )
+        # Power (kW) over a step of dt[t] hours changes the SOC (kWh)
+        s_prev = s0 if t == 0 else s[t - 1]
+        m.Equation(
+            s[t]
+            == s_prev
+            + dt[t] * (charge_eff * x_charge[t] - x_discharge[t] / discharge_eff - loss)
+        )
 
     for t in range(nt):
         m.Equation(x_charge[t] <= P_charge_max * y_charge[t])
@@ -63,7 +72,8 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
 
     df = pd.DataFrame(
         {
-            "Hour": range(nt),
+            "Hour": start,
+            "Duration": dt,
             "Solar": E_solar,
             "Demand": E_demand,
             "Buy": [round(x.value[0], 3) for x in x_buy],
@@ -77,7 +87,7 @@ def solve_scenario(C_sell, scenario_name, results_folder, save_results=True):
     )
 
     actual_cost = m.options.objfcnval
-    exported = df["Sell"].sum()
+    exported = (df["Sell"] * df["Duration"]).sum()
 
     if not save_results:
         return {
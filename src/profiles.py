@@ -1,3 +1,81 @@
-def variable_tariff_profile(off_peak_price, peak_price):
+from math import fsum, isclose
+
+from constants import (C_buy, E_demand, E_solar, adaptive, aggregation_tol,
+                       step_minutes)
+
+
+def variable_tariff_profile(off_peak_price, peak_price, step_minutes=60):
     """Build 24h sell-price profile (AMD/kWh): off-peak for hours 0-6 and 23, peak for 7-22."""
-    return [off_peak_price] * 7 + [peak_price] * 16 + [off_peak_price]
+    hourly = [off_peak_price] * 7 + [peak_price] * 16 + [off_peak_price]
+    return resample_profile(hourly, step_minutes)
+
+
+def resample_profile(values, step_minutes):
+    """Resample a uniform 24h profile to `step_minutes` steps (repeat when finer, average when coarser)."""
+    if (
+        not isinstance(step_minutes, int)
+        or step_minutes <= 0
+        or 1440 % step_minutes
+    ):
+        raise ValueError(
+            f"Cannot resample {len(values)} values to {step_minutes}-minute steps"
+        )
+    n = 1440 // step_minutes
+    if n % len(values) == 0:
+        return [v for v in values for _ in range(n // len(values))]
+    if len(values) % n == 0:
+        r = len(values) // n
+        return [sum(values[i * r : (i + 1) * r]) / r for i in range(n)]
+    raise ValueError(
+        f"Cannot resample {len(values)} values to {step_minutes}-minute steps"
+    )
+
+
+def aggregate_steps(profiles, dt, tol):
+    """Merge consecutive steps where every profile stays within tol * (its range); returns (durations, profiles)."""
+    spans = [tol * (max(p) - min(p)) for p in profiles]
+    blocks = []
+    start = 0
+    lo = [p[0] for p in profiles]
+    hi = [p[0] for p in profiles]
+    for t in range(1, len(profiles[0])):
+        lo = [min(l, p[t]) for l, p in zip(lo, profiles)]
+        hi = [max(h, p[t]) for h, p in zip(hi, profiles)]
+        if any(h - l > span for l, h, span in zip(lo, hi, spans)):
+            blocks.append((start, t))
+            start = t
+            lo = [p[t] for p in profiles]
+            hi = [p[t] for p in profiles]
+    blocks.append((start, len(profiles[0])))
+
+    durations = [fsum(dt[a:b]) for a, b in blocks]
+    merged = [
+        [
+            fsum(p[i] * dt[i] for i in range(a, b)) / d
+            for (a, b), d in zip(blocks, durations)
+        ]
+        for p in profiles
+    ]
+    return durations, merged
+
+
+def time_grid(
+    C_sell, step_minutes=step_minutes, adaptive=adaptive, tol=aggregation_tol
+):
+    """Build the optimization time grid; returns (start hours, durations in h, solar, demand, buy, sell)."""
+    profiles = [
+        resample_profile(p, step_minutes) for p in (E_solar, E_demand, C_buy, C_sell)
+    ]
+    dt = [step_minutes / 60] * len(profiles[0])
+    if adaptive:
+        totals = [fsum(v * d for v, d in zip(p, dt)) for p in profiles]
+        dt, profiles = aggregate_steps(profiles, dt, tol)
+        # Aggregation must cover the whole day and keep every profile's energy/cost total
+        if not isclose(fsum(dt), 24) or not all(
+            isclose(fsum(v * d for v, d in zip(p, dt)), total, abs_tol=1e-9)
+            for p, total in zip(profiles, totals)
+        ):
+            raise ValueError("Adaptive aggregation changed the 24h profile totals")
+
+    start = [fsum(dt[:t]) for t in range(len(dt))]
+    return (start, dt, *profiles)